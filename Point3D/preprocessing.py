@@ -1,7 +1,78 @@
 import os
-from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Callable
 import numpy as np
-import open3d as o3d
+
+try:  # numba 为可选依赖，未安装时使用纯 NumPy 实现
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+@dataclass(eq=False)
+class Split(Mapping):
+    """
+    xyz_2Dsplit 的分块结果，以连续数组 (SoA) 存储所有分块的点索引。
+
+    与原先返回的 dict 用法一致：键为非空分块的位置 (row, col)，按行优先顺序排列，值为该块的点索引数组；
+    keys()/items()/values()、in、len、迭代均只涉及非空分块，split[(row, col)] 对空块返回空数组。
+
+    Attributes:
+        indices: 所有分块的点索引依次拼接而成的一维数组
+        offsets: 长度为 块数 + 1 的数组，第 c 块 (row * W + col) 的索引为 indices[offsets[c]:offsets[c + 1]]
+        shape: 分块网格的形状 (H, W)
+    """
+    indices: np.ndarray
+    offsets: np.ndarray
+    shape: tuple
+
+    @property
+    def counts(self) -> np.ndarray:
+        """形状为 (H, W) 的数组，每个分块包含的点数"""
+        return np.diff(self.offsets).reshape(self.shape)
+
+    def _cell(self, n: int, m: int) -> np.ndarray:
+        if not (0 <= n < self.shape[0] and 0 <= m < self.shape[1]):
+            return self.indices[:0]
+        c = n * self.shape[1] + m
+        return self.indices[self.offsets[c]:self.offsets[c + 1]]
+
+    def get(self, n, m=None):
+        """
+        split.get(n, m) 返回第 n 行、第 m 列分块包含的点的索引（空块返回空数组）；
+        与 dict 相同，split.get((n, m), default) 在该块为空时返回 default。
+        """
+        if isinstance(n, tuple):
+            return self[n] if n in self else m
+        return self._cell(n, m)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Split):
+            return NotImplemented
+        return (tuple(self.shape) == tuple(other.shape) and np.array_equal(self.offsets, other.offsets)
+                and np.array_equal(self.indices, other.indices))
+
+    def __getitem__(self, key) -> np.ndarray:
+        try:
+            n, m = key
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+        return self._cell(n, m)
+
+    def __contains__(self, key) -> bool:
+        try:
+            n, m = key
+        except (TypeError, ValueError):
+            return False
+        return self._cell(n, m).size > 0
+
+    def __iter__(self):
+        return (divmod(c, self.shape[1]) for c in np.flatnonzero(np.diff(self.offsets)).tolist())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(np.diff(self.offsets)))
+
 
 def xyz_density(pt_xyz: np.ndarray) -> np.ndarray:
     """
@@ -19,9 +90,11 @@ def xyz_density(pt_xyz: np.ndarray) -> np.ndarray:
        Note:
            该方法适合于大规模点云数据的局部密度分析，有助于评估点云的密集程度。
        """
+    import open3d as o3d  # 仅此函数需要 open3d，分块等函数不依赖它
+
     # 将数据转换为 Open3D 点云对象
     pcd = o3d.geometry.PointCloud()
-    pcd.points = o3d.utility.Vector3dVector(pt_xyz)
+    pcd.points = o3d.utility.Vector3dVector(np.asarray(pt_xyz, dtype=np.float64))  # Vector3dVector 仅在 float64 时走快速路径
 
     # 创建KDTree
     pcd_tree = o3d.geometry.KDTreeFlann(pcd)
@@ -37,10 +110,94 @@ def xyz_density(pt_xyz: np.ndarray) -> np.ndarray:
 
 
 
+# 8 邻域的 (行, 列) 偏移
+_NEIGHBOR_OFFSETS = tuple((di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0))
+
+# 重叠分块的展开表：以 (X 跨块, Y 跨块) 的 2 位掩码为下标，
+# 指示候选块 (yLo, xLo)、(yLo, xHi)、(yHi, xLo)、(yHi, xHi) 中哪些需要保留
+_OVERLAP_EMIT = np.array([[True, False, False, False],
+                          [True, True, False, False],
+                          [True, False, True, False],
+                          [True, True, True, True]])
+
+
+def _axis_edges(minimum: float, step: float, nums: int, dtype) -> np.ndarray:
+    """
+    生成一维分块的起始边界 minimum + i * step (i = 0..nums)，与坐标同精度。
+    NumPy 与 numba 两种实现都基于同一组边界分块，保证结果一致。
+    """
+    return (minimum + np.arange(nums + 1) * step).astype(dtype)
+
+
+def _axis_bins(axis: np.ndarray, edges: np.ndarray, step: float, size: float):
+    """
+    计算一维坐标落入的分块范围。第 i 块覆盖 [edges[i], edges[i] + size)，最后一块包含最大值。
+
+    Args:
+        axis: 坐标（一维数组）
+        edges: 由 _axis_edges 生成的分块起始边界
+        step: 分块的步进长度
+        size: 分块的尺寸
+    Returns:
+        lo, hi: 每个点所属分块编号的下界与上界（闭区间）
+    """
+    # 只在块边界上做二分查找，不生成任何全长的中间掩码
+    hi = np.clip(np.searchsorted(edges, axis, side='right') - 1, 0, edges.size - 1)
+    if size <= step:
+        # 该轴无重叠：每个点只属于 hi 一块，与 _bin_points 的规则相同
+        return hi, hi
+    lo = np.minimum(np.searchsorted(edges + size, axis, side='right'), hi)
+    return lo, hi
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _bin_points(hx, vx, x_edges, y_edges):
+        """
+        无重叠分块的单次遍历内核：并行计算每个点所在的块号，并统计每个块的点数。
+        块号按 _axis_edges 生成的同一组边界二分查找得到，与 NumPy 实现 (_axis_bins) 的结果一致。
+
+        Returns:
+            counts: 形状为 (ny, nx) 的数组，每个块包含的点数
+            cell_of_point: 形状为 (N,) 的数组，每个点所在块的一维编号 (row * nx + col)
+        """
+        n = hx.shape[0]
+        nx, ny = x_edges.shape[0], y_edges.shape[0]
+        cell_of_point = np.empty(n, dtype=np.int64)
+        for i in prange(n):
+            bx = min(max(np.searchsorted(x_edges, hx[i], side='right') - 1, 0), nx - 1)
+            by = min(max(np.searchsorted(y_edges, vx[i], side='right') - 1, 0), ny - 1)
+            cell_of_point[i] = by * nx + bx
+        counts = np.zeros((ny, nx), dtype=np.int64)
+        flat_counts = counts.reshape(-1)
+        for i in range(n):
+            flat_counts[cell_of_point[i]] += 1
+        return counts, cell_of_point
+else:
+    _bin_points = None
+
+
+def _find_roots(parent: np.ndarray) -> np.ndarray:
+    """
+    并查集的向量化路径压缩：反复令 parent = parent[parent]，直到每个元素都直接指向其根。
+
+    Args:
+        parent: 每个元素的父节点编号（根节点指向自身）
+    Returns:
+        root: 每个元素所在集合的根节点编号
+    """
+    root = parent
+    while True:
+        nxt = root[root]
+        if np.array_equal(nxt, root):
+            return root
+        root = nxt
+
+
 # 纯净版
 def xyz_2Dsplit(horizontalAxis: np.ndarray, verticalAxis: np.ndarray, rowH: float, colW: float,
                 overlapH: float = 0, overlapW: float = 0, areaBrokenMerge: bool = True,
-                ptBrokenMerge: int = None) -> defaultdict:
+                ptBrokenMerge: int = None, on_stage: Callable[[str, np.ndarray], None] = None) -> Split:
     """
     将二维坐标 (horizontalAxis, verticalAxis) 按照指定的行列大小 (rowH, colW) 进行分割，并允许设置重叠度 (overlapH, overlapW)，以及是否合并分割后不足尺寸的区域。
 
@@ -53,142 +210,163 @@ def xyz_2Dsplit(horizontalAxis: np.ndarray, verticalAxis: np.ndarray, rowH: floa
         overlapW: 水平方向块之间的重叠度，范围在 [0, 1) 之间
         areaBrokenMerge: 控制是否合并最后不足指定大小的分块。如果为 True，则将剩余的小块合并到前一块
         ptBrokenMerge: 如果提供，则当某个分块包含的点数少于此值时，尝试将其与相邻的分块合并
+        on_stage: 如果提供，则在各阶段结束后以 (阶段名, 形状为 (H, W) 的分块点数) 调用，阶段名依次为
+                  'initial'（初步分块）、'area_merged'（areaBrokenMerge 之后）、'pt_merged'（ptBrokenMerge 之后）
     Returns:
-        split_idx:每个分块包含的点的索引 Location(H,W) & ID[]
+        split_idx: 每个分块包含的点的索引 Location(H,W) & ID[]，通过 split_idx.get(H, W) 或 split_idx[(H, W)] 获取
+    """
+    # 将两个坐标轴一次性写入 (N, 2) 的连续 float32 数组，后续每个点的两个坐标位于同一缓存行。
+    # 分块只需要相对位置，先减去各轴最小值再降为 float32，大坐标值（如投影坐标）也不会损失精度
+    xy = np.empty((np.size(horizontalAxis), 2), dtype=np.float32)
+    np.subtract(horizontalAxis, np.min(horizontalAxis), out=xy[:, 0], casting='same_kind')
+    np.subtract(verticalAxis, np.min(verticalAxis), out=xy[:, 1], casting='same_kind')
+    return xyz_2Dsplit_xy(xy, rowH, colW, overlapH, overlapW, areaBrokenMerge, ptBrokenMerge, on_stage)
+
+
+def xyz_2Dsplit_xy(xy: np.ndarray, rowH: float, colW: float, overlapH: float = 0, overlapW: float = 0,
+                   areaBrokenMerge: bool = True, ptBrokenMerge: int = None,
+                   on_stage: Callable[[str, np.ndarray], None] = None) -> Split:
     """
-    split_idx = defaultdict(list)  # 用于存储每个分块的索引信息
+    与 xyz_2Dsplit 相同，但输入为形状 (N, 2) 的连续坐标数组，第 0 列为水平方向，第 1 列为垂直方向。
+
+    Args:
+        xy: 形状为 (N, 2) 的数组，表示 N 个点的 (水平, 垂直) 坐标，推荐使用 float32 以减少内存带宽
+        其余参数与 xyz_2Dsplit 相同
+    Returns:
+        split_idx: 每个分块包含的点的索引 Location(H,W) & ID[]，通过 split_idx.get(H, W) 或 split_idx[(H, W)] 获取
+    """
+    xy = np.asarray(xy)
+    if xy.dtype not in (np.float32, np.float64):
+        # float16、longdouble 及整数等其他类型统一转为 float32，保证 numba 与 NumPy 两种实现都能处理
+        xy = xy.astype(np.float32)
+    if xy.ndim != 2 or xy.shape[1] != 2:
+        raise ValueError(f"xy 的形状必须为 (N, 2)，当前为 {xy.shape}")
+    horizontalAxis, verticalAxis = xy[:, 0], xy[:, 1]
+    (minX, minY), (maxX, maxY) = xy.min(axis=0), xy.max(axis=0)
 
     # 计算 X 轴相关参数
-    maxX, minX = horizontalAxis.max(), horizontalAxis.min()
     rangeX = maxX - minX
     stepX = colW * (1 - overlapW)  # 每次步进的长度
     xNums, xExtra = divmod(rangeX, stepX)  # 分割块数与余数
 
     # 计算 Y 轴相关参数
-    maxY, minY = verticalAxis.max(), verticalAxis.min()
     rangeY = maxY - minY
     stepY = rowH * (1 - overlapH)
     yNums, yExtra = divmod(rangeY, stepY)
 
-    # 生成布尔掩码列表
-    judgeXresult = [
-        (minX + i * stepX <= horizontalAxis) & (horizontalAxis <= np.clip(minX + i * stepX + colW, minX, maxX))
-        for i in range(int(xNums) + 1)]
-    judgeYresult = [
-        (minY + j * stepY <= verticalAxis) & (verticalAxis <= np.clip(minY + j * stepY + rowH, minY, maxY))
-        for j in range(int(yNums) + 1)]
-
-    # 使用 np.where 联合判定 X 和 Y
-    for n, judgeY in enumerate(judgeYresult):  # 先遍历行
-        for m, judgeX in enumerate(judgeXresult):  # 再遍历列
-            valid_idx = np.where(judgeX & judgeY)[0]  # 提取符合条件的索引
-            if valid_idx.size > 0:
-                split_idx[(n, m)].extend(valid_idx.tolist())  # 存储索引信息
+    # 直接计算每个点所属的行列块号（cell = row * nx + col），以 (cell, pt_id) 对的形式记录，避免为每一行/列生成全长的布尔掩码
+    nx, ny = int(xNums) + 1, int(yNums) + 1
+    xEdges = _axis_edges(minX, stepX, int(xNums), horizontalAxis.dtype)
+    yEdges = _axis_edges(minY, stepY, int(yNums), verticalAxis.dtype)
+    if overlapW == 0 and overlapH == 0 and _bin_points is not None:
+        # 无重叠且安装了 numba 时，由并行内核一次完成块号计算与计数
+        counts, cell = _bin_points(horizontalAxis, verticalAxis, xEdges, yEdges)
+        counts = counts.reshape(-1)
+        pt_id = np.arange(horizontalAxis.size)
+    else:
+        xLo, xHi = _axis_bins(horizontalAxis, xEdges, stepX, colW)
+        yLo, yHi = _axis_bins(verticalAxis, yEdges, stepY, rowH)
+        if overlapW == 0 and overlapH == 0:
+            # 无重叠时每个点只属于一个块
+            pt_id = np.arange(horizontalAxis.size)
+            cell = yHi * nx + xHi
+        elif (xHi - xLo).max() <= 1 and (yHi - yLo).max() <= 1:
+            # 重叠度不超过 50% 时每个点在每个轴上最多属于 2 块：固定展开 4 个候选块，
+            # 再以 2 位掩码 (X 跨块, Y 跨块) 查表去掉重复的候选，全程无分支
+            cells = np.stack([yLo * nx + xLo, yLo * nx + xHi, yHi * nx + xLo, yHi * nx + xHi], axis=1)
+            keep = _OVERLAP_EMIT[(xHi != xLo) | ((yHi != yLo) << 1)].reshape(-1)
+            pt_id = np.repeat(np.arange(horizontalAxis.size), 4)[keep]
+            cell = cells.reshape(-1)[keep]
+        else:
+            # 有重叠时每个点在每个轴上属于 [Lo, Hi] 范围内的若干块，按 X 块数 × Y 块数展开
+            xCnt, yCnt = xHi - xLo + 1, yHi - yLo + 1
+            repeats = xCnt * yCnt
+            pt_id = np.repeat(np.arange(horizontalAxis.size), repeats)
+            k = np.arange(pt_id.size) - np.repeat(np.cumsum(repeats) - repeats, repeats)  # 每个点内部的展开序号
+            xCnt = xCnt[pt_id]
+            cell = (yLo[pt_id] + k // xCnt) * nx + xLo[pt_id] + k % xCnt
+        counts = np.bincount(cell, minlength=nx * ny)
+    if on_stage is not None:
+        on_stage('initial', counts.reshape(ny, nx).copy())
+
+    # 以并查集记录块之间的合并关系，parent[c] 指向 c 被合并进的块，最后统一归并点索引
+    parent = np.arange(nx * ny)
 
     # 如果启用了 areaBrokenMerge，则处理不足尺寸的分块
     if areaBrokenMerge:
+        counts2d = counts.reshape(ny, nx)
         # 合并最右边的列
-        if xExtra < colW:
-            for n in range(len(judgeYresult)):
-                if (n, int(xNums)) in split_idx and (n, int(xNums) - 1) in split_idx:
-                    # 将最右边的列与前一列合并
-                    split_idx[(n, int(xNums) - 1)].extend(split_idx.pop((n, int(xNums))))
+        if xExtra < colW and nx > 1:
+            rows = np.flatnonzero((counts2d[:, -1] > 0) & (counts2d[:, -2] > 0))
+            # 将最右边的列与前一列合并
+            parent[rows * nx + nx - 1] = rows * nx + nx - 2
+            counts2d[rows, -2] += counts2d[rows, -1]
+            counts2d[rows, -1] = 0
         # 合并最下面的行
-        if yExtra < rowH:
-            for m in range(len(judgeXresult)):
-                if (int(yNums), m) in split_idx and (int(yNums) - 1, m) in split_idx:
-                    # 将最下面的行与上一行合并
-                    split_idx[(int(yNums) - 1, m)].extend(split_idx.pop((int(yNums), m)))
+        if yExtra < rowH and ny > 1:
+            cols = np.flatnonzero((counts2d[-1] > 0) & (counts2d[-2] > 0))
+            # 将最下面的行与上一行合并
+            parent[(ny - 1) * nx + cols] = (ny - 2) * nx + cols
+            counts2d[-2, cols] += counts2d[-1, cols]
+            counts2d[-1, cols] = 0
+        if on_stage is not None:
+            on_stage('area_merged', counts.reshape(ny, nx).copy())
 
-    # 合并小于 ptBrokenMerge 的块
+    # 合并小于 ptBrokenMerge 的块（块的点数只增不减，因此只需遍历初始时的小块）
     if ptBrokenMerge is not None:
-        for (rows, cols), pt_id in list(split_idx.items()):
-            if len(pt_id) <= ptBrokenMerge:
-                # 查找相邻块
-                neighbor_blocks = [(rows + di, cols + dj) for di in [-1, 0, 1] for dj in [-1, 0, 1]
-                                   if (di != 0 or dj != 0) and (rows + di, cols + dj) in split_idx]
+        for c in np.flatnonzero((counts > 0) & (counts <= ptBrokenMerge)).tolist():
+            if counts[c] <= ptBrokenMerge:
+                rows, cols = divmod(c, nx)
+                # 查找相邻块（点数非零的块即为未被合并的根块）
+                neighbor_blocks = [(rows + di) * nx + cols + dj for di, dj in _NEIGHBOR_OFFSETS
+                                   if 0 <= rows + di < ny and 0 <= cols + dj < nx
+                                   and counts[(rows + di) * nx + cols + dj] > 0]
                 if neighbor_blocks:
                     # 找到最近且点数最少的块
-                    ni, nj = min(neighbor_blocks, key=lambda blk: len(split_idx[blk]))
-                    split_idx[(ni, nj)].extend(split_idx.pop((rows, cols)))
+                    target = min(neighbor_blocks, key=lambda blk: counts[blk])
+                    parent[c] = target
+                    counts[target] += counts[c]
+                    counts[c] = 0
+        if on_stage is not None:
+            on_stage('pt_merged', counts.reshape(ny, nx).copy())
+
+    # 一次性将每个点对映射到其最终所在的根块
+    cell = _find_roots(parent)[cell]
+
+    # 按块号稳定排序，每个块的索引连续存放且保持升序
+    index_dtype = np.int32 if horizontalAxis.size <= np.iinfo(np.int32).max else np.int64
+    indices = pt_id[np.argsort(cell, kind='stable')].astype(index_dtype)
+    offsets = np.zeros(nx * ny + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
     # 返回分割结果
-    return split_idx
+    return Split(indices, offsets, (ny, nx))
 
 
 
-# 控制台输出分割点的数量分布
-def xyz_2Dsplit_show(horizontalAxis: np.ndarray, verticalAxis: np.ndarray, rowH: float, colW: float, overlapH: float = 0, overlapW: float = 0, areaBrokenMerge: bool = True, ptBrokenMerge: int = None) -> defaultdict:
-    print('')
-    split_idx = defaultdict(list)  
+def _format_counts(counts: np.ndarray) -> str:
+    """将 (H, W) 的分块点数格式化为表格字符串，空块留白"""
+    return '\n'.join(''.join(f'{c:6d},' if c else '      ,' for c in row) for row in counts.tolist())
 
-    maxX, minX = horizontalAxis.max(), horizontalAxis.min()
-    rangeX = maxX - minX
-    stepX = colW * (1 - overlapW)  
-    xNums, xExtra = divmod(rangeX, stepX)  
 
-    maxY, minY = verticalAxis.max(), verticalAxis.min()
-    rangeY = maxY - minY
-    stepY = rowH * (1 - overlapH)
-    yNums, yExtra = divmod(rangeY, stepY)
-    print(f'总点数：{horizontalAxis.size}\n'
-          f'高：{rangeY:0.2f} 宽：{rangeX:0.2f}\n'
-          f'分割高：{rowH:0.2f} 分割宽：{colW:0.2f}\n'
-          f'纵向重叠：{overlapH * 100}% 横向重叠：{overlapW * 100}%\n'
-          f'分割为 {int(yNums) + 1}✖{int(xNums) + 1} 块(包含空白)\n')
-
-    judgeXresult = [
-        (minX + i * stepX <= horizontalAxis) & (horizontalAxis <= np.clip(minX + i * stepX + colW, minX, maxX))
-        for i in range(int(xNums) + 1)]
-    judgeYresult = [(minY + j * stepY <= verticalAxis) & (verticalAxis <= np.clip(minY + j * stepY + rowH, minY, maxY))
-                    for j in range(int(yNums) + 1)]
-
-    print('初步分块的点数分布')
-    for n, judgeY in enumerate(judgeYresult):  
-        for m, judgeX in enumerate(judgeXresult):  
-            valid_idx = np.where(judgeX & judgeY)[0]  
-            if valid_idx.size > 0:
-                split_idx[(n, m)].extend(valid_idx.tolist())  
-            print(f'{valid_idx.size:6d},', end='') if valid_idx.size > 0 else print(f'      ,', end='')
-        print('')
+# 控制台输出分割点的数量分布
+def xyz_2Dsplit_show(horizontalAxis: np.ndarray, verticalAxis: np.ndarray, rowH: float, colW: float, overlapH: float = 0, overlapW: float = 0, areaBrokenMerge: bool = True, ptBrokenMerge: int = None) -> Split:
+    rangeX = horizontalAxis.max() - horizontalAxis.min()
+    rangeY = verticalAxis.max() - verticalAxis.min()
+    titles = {'initial': '初步分块的点数分布',
+              'area_merged': f'\n开始(向左/上)合并不足{rowH}✖{colW}的块\n合并后分块的点数分布:',
+              'pt_merged': f'\n开始合并点数小于{ptBrokenMerge}的分块:\n合并后分块的点数分布:'}
 
-    if areaBrokenMerge:
-        print(f'\n开始(向左/上)合并不足{rowH}✖{colW}的块')
-        if xExtra < colW:
-            for n in range(len(judgeYresult)):
-                if (n, int(xNums)) in split_idx and (n, int(xNums) - 1) in split_idx:
-                    split_idx[(n, int(xNums) - 1)].extend(split_idx.pop((n, int(xNums))))
-        if yExtra < rowH:
-            for m in range(len(judgeXresult)):
-                if (int(yNums), m) in split_idx and (int(yNums) - 1, m) in split_idx:
-                    split_idx[(int(yNums) - 1, m)].extend(split_idx.pop((int(yNums), m)))
-
-        print(f'合并后分块的点数分布:')
-        for row in range(len(judgeYresult)):
-            for col in range(len(judgeXresult)):
-                if (row, col) in split_idx:
-                    print(f'{len(split_idx[(row, col)]):6d},', end='')
-                else:
-                    print(f'      ,', end='')
-            print('')  
-    else:
-        print(f'\n禁止(向左/上)合并不足{rowH}✖{colW}的块')
+    def print_stage(stage: str, counts: np.ndarray):
+        text = f'{titles[stage]}\n{_format_counts(counts)}'
+        if stage == 'initial':
+            text = (f'\n总点数：{horizontalAxis.size}\n'
+                    f'高：{rangeY:0.2f} 宽：{rangeX:0.2f}\n'
+                    f'分割高：{rowH:0.2f} 分割宽：{colW:0.2f}\n'
+                    f'纵向重叠：{overlapH * 100}% 横向重叠：{overlapW * 100}%\n'
+                    f'分割为 {counts.shape[0]}✖{counts.shape[1]} 块(包含空白)\n\n{text}')
+            if not areaBrokenMerge:
+                text += f'\n\n禁止(向左/上)合并不足{rowH}✖{colW}的块'
+        print(text)
 
-    if ptBrokenMerge is not None:
-        print(f'\n开始合并点数小于{ptBrokenMerge}的分块:')
-        for (rows, cols), pt_id in list(split_idx.items()):
-            if len(pt_id) <= ptBrokenMerge:
-                neighbor_blocks = [(rows + di, cols + dj) for di in [-1, 0, 1] for dj in [-1, 0, 1]
-                                   if (di != 0 or dj != 0) and (rows + di, cols + dj) in split_idx]
-                if neighbor_blocks:
-                    ni, nj = min(neighbor_blocks, key=lambda blk: len(split_idx[blk]))
-                    split_idx[(ni, nj)].extend(split_idx.pop((rows, cols)))
-        print(f'合并后分块的点数分布:')
-        for row in range(len(judgeYresult)):
-            for col in range(len(judgeXresult)):
-                if (row, col) in split_idx:
-                    print(f'{len(split_idx[(row, col)]):6d},', end='')  
-                else:
-                    print(f'      ,', end='')  
-            print('')  
-
-    return split_idx
+    return xyz_2Dsplit(horizontalAxis, verticalAxis, rowH, colW, overlapH, overlapW, areaBrokenMerge, ptBrokenMerge,
+                       on_stage=print_stage)
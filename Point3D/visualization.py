@@ -1,6 +1,6 @@
+import time
 import numpy as np
 import open3d as o3d
-from sklearn.metrics import confusion_matrix
 
 label_colors = {
     0: [0.5, 0.5, 0.5],  #
@@ -11,7 +11,52 @@ label_colors = {
 }
 
 
-def xyz_visual(pt_xyz: np, pt_colors: np = None, pt_labels: np = None, label2colors: dict = None):
+def _label_lut(label2colors: dict):
+    """
+    当 label2colors 的键恰好为 0..K-1 的整数时，生成 (K, 3) 的 float32 颜色查找表，整数标签可直接按下标取色；否则返回 None。
+    """
+    keys = list(label2colors.keys())
+    # bool 也是 int 的子类，但作为下标会变成布尔掩码，交给逐类别写入的路径处理
+    if not keys or not all(isinstance(k, (int, np.integer)) and not isinstance(k, bool) for k in keys) \
+            or sorted(keys) != list(range(len(keys))):
+        return None
+    lut = np.zeros((len(keys), 3), dtype=np.float32)
+    lut[keys] = np.asarray(list(label2colors.values()), dtype=np.float32)
+    return lut
+
+
+def _labels_to_colors(pt_labels: np.ndarray, label2colors: dict = None) -> np.ndarray:
+    """
+    根据类别标签生成每个点的颜色，未提供 label2colors 时为每个标签生成随机颜色。
+
+    Returns:
+        numpy.ndarray: 形状为 (N, 3) 的颜色数组。
+    """
+    pt_labels = np.asarray(pt_labels)
+    if label2colors is not None and pt_labels.dtype.kind in 'iu' and pt_labels.size > 0:
+        # 整数标签：直接用查找表一次性取色
+        lut = _label_lut(label2colors)
+        if lut is not None and pt_labels.min() >= 0 and pt_labels.max() < len(lut):
+            return lut[pt_labels]
+    if label2colors is not None:
+        # 其他标签：预分配输出，按映射中的每个类别整体写入颜色，字典只访问 K 次
+        colors = np.empty((pt_labels.shape[0], 3), dtype=np.float64)
+        assigned = 0
+        for label, rgb in label2colors.items():
+            mask = (pt_labels == label)
+            colors[mask] = rgb
+            assigned += np.count_nonzero(mask)
+        if assigned != pt_labels.shape[0]:
+            raise KeyError(pt_labels[~np.isin(pt_labels, list(label2colors.keys()))][0])
+        return colors
+    # 如果没有 label2colors 映射，则为每个唯一标签生成随机颜色，按反索引一次性取色
+    unique_labels, inverse = np.unique(pt_labels, return_inverse=True)
+    palette = np.random.rand(unique_labels.size, 3)
+    return palette[inverse.reshape(-1)]
+
+
+def xyz_visual(pt_xyz: np, pt_colors: np = None, pt_labels: np = None, label2colors: dict = None,
+               max_points: int = None):
     """
     可视化三维点云数据，支持基于点颜色或类别标签的渲染方式。
 
@@ -20,6 +65,8 @@ def xyz_visual(pt_xyz: np, pt_colors: np = None, pt_labels: np = None, label2col
         pt_colors (numpy.ndarray, optional): 形状为 (N, 3) 的数组，表示每个点的 RGB 颜色值，值域为 [0,1]。默认值为 None。
         pt_labels (numpy.ndarray, optional): 形状为 (N,) 的数组，表示每个点的类别标签。默认值为 None。
         label2colors (dict, optional): 字典，映射每个类别标签到相应的 RGB 颜色数组。如果 `pt_labels` 存在且未提供 `pt_colors`，则根据该映射上色。默认值为 None。
+        max_points (int, optional): 显示的最大点数。点数超过该值时先随机下采样到 max_points 个点再构建点云，以限制渲染开销。
+            默认值为 None（不下采样），交互查看时建议不超过 500000。
 
     Raises:
         ValueError: 如果既未提供 `pt_colors`，也未提供 `pt_labels` 和 `label2colors`，将抛出错误。
@@ -36,33 +83,84 @@ def xyz_visual(pt_xyz: np, pt_colors: np = None, pt_labels: np = None, label2col
         该方法用于快速查看三维点云，并可通过标签进行分割、上色，从而帮助识别各类的点分布。
 
     """
+    # 点数过多时随机下采样，坐标与颜色/标签使用同一组索引
+    if max_points is not None and len(pt_xyz) > max_points:
+        idx = np.random.choice(len(pt_xyz), max_points, replace=False)
+        pt_xyz = np.asarray(pt_xyz)[idx]
+        pt_colors = None if pt_colors is None else np.asarray(pt_colors)[idx]
+        pt_labels = None if pt_labels is None else np.asarray(pt_labels)[idx]
+
     # 如果提供了颜色，则直接使用
     if pt_colors is not None:
         # 使用提供的 pt_colors 作为颜色
         colors = pt_colors
     elif pt_labels is not None:
-        # 如果没有提供 pt_colors，且提供了标签
-        if label2colors is not None:
-            # 根据标签和 label2colors 映射生成颜色
-            colors = np.array([label2colors[label] for label in pt_labels])
-        else:
-            # 如果没有 label2colors 映射，则为每个标签生成随机颜色
-            unique_labels = np.unique(pt_labels)
-            label2colors = {label: np.random.rand(3) for label in unique_labels}
-            colors = np.array([label2colors[label] for label in pt_labels])
+        # 如果没有提供 pt_colors，且提供了标签，则根据 label2colors 映射（或随机颜色）生成颜色
+        colors = _labels_to_colors(pt_labels, label2colors)
     else:
         # 如果既没有提供 pt_colors，也没有提供 pt_labels，则抛出异常
         raise ValueError("必须提供 颜色 或者 类别、映射颜色")
-    # 创建点云对象并设置颜色
-    pcd = o3d.geometry.PointCloud()
-    pcd.points = o3d.utility.Vector3dVector(pt_xyz)  # 设置点云的坐标
-    pcd.colors = o3d.utility.Vector3dVector(colors)  # 设置点云的颜色
+    # 创建 Tensor 点云对象并设置颜色（from_numpy 直接共享 float32 连续内存，避免 Vector3dVector 的逐点拷贝）
+    pcd = o3d.t.geometry.PointCloud(o3d.core.Device("CPU:0"))
+    pcd.point.positions = o3d.core.Tensor.from_numpy(np.ascontiguousarray(pt_xyz, dtype=np.float32))  # 设置点云的坐标
+    pcd.point.colors = o3d.core.Tensor.from_numpy(np.ascontiguousarray(colors, dtype=np.float32))  # 设置点云的颜色
 
     # 可视化点云
-    o3d.visualization.draw_geometries([pcd], window_name="PointCloud", width=800, height=600)
+    o3d.visualization.draw([pcd], title="PointCloud", width=800, height=600)
 
 
-def xyz_visual_difference(pt_xyz, label_gt, label_pred, Data_Graphics: bool = True, idx2Graphics: int = None):
+class LiveXYZVisualizer:
+    """
+    复用同一个窗口的点云可视化器，适合连续查看多组点云（如逐类别浏览）。
+
+    每次调用 `update` 只替换点云的坐标与颜色并刷新渲染，避免每组点云都重新创建窗口；
+    调用 `wait` 阻塞直到用户按下 `next_key` 切换到下一组，或关闭窗口。
+
+    Example:
+        live = LiveXYZVisualizer()
+        for xyz, colors in frames:
+            live.update(xyz, colors)
+            if not live.wait():
+                break
+        live.close()
+    """
+
+    def __init__(self, window_name: str = "PointCloud", width: int = 800, height: int = 600, next_key: str = 'N'):
+        self.vis = o3d.visualization.VisualizerWithKeyCallback()
+        self.vis.create_window(window_name=window_name, width=width, height=height)
+        self.pcd = o3d.geometry.PointCloud()
+        self.vis.add_geometry(self.pcd)
+        self.vis.register_key_callback(ord(next_key.upper()), self._on_next)
+        self._advance = False
+
+    def _on_next(self, vis) -> bool:
+        self._advance = True
+        return False
+
+    def update(self, pt_xyz: np.ndarray, colors: np.ndarray):
+        """替换窗口中点云的坐标与颜色，并重置视角以适应新的点云范围"""
+        self.pcd.points = o3d.utility.Vector3dVector(np.asarray(pt_xyz, dtype=np.float64))
+        self.pcd.colors = o3d.utility.Vector3dVector(np.asarray(colors, dtype=np.float64))
+        self.vis.update_geometry(self.pcd)
+        self.vis.reset_view_point(True)
+        self.vis.poll_events()
+        self.vis.update_renderer()
+
+    def wait(self) -> bool:
+        """阻塞直到按下 next_key（返回 True）或窗口被关闭（返回 False）"""
+        self._advance = False
+        while not self._advance:
+            if not self.vis.poll_events():
+                return False
+            self.vis.update_renderer()
+            time.sleep(0.01)
+        return True
+
+    def close(self):
+        self.vis.destroy_window()
+
+
+def xyz_visual_difference(pt_xyz, label_gt, label_pred, Data_Graphics: bool = True, idx2Graphics=None):
     """
     可视化三维点云数据的预测与真实标签差异，自动选择输出或图形化方式。
 
@@ -71,10 +169,11 @@ def xyz_visual_difference(pt_xyz, label_gt, label_pred, Data_Graphics: bool = Tr
         - label_gt (ndarray): 真实标签数组，与 pt_xyz 一一对应。
         - label_pred (ndarray): 预测标签数组，与 pt_xyz 一一对应。
         - Data_Graphics (bool): 可选参数，默认为 True，指示是否打印每个类别的混淆矩阵信息。
-        - idx2Graphics (int): 可选参数，指定要可视化的类别的标签编号。如果为 None，则随机选取一个类别进行可视化。
+        - idx2Graphics (int | list): 可选参数，指定要可视化的类别的标签编号。如果为 None，则随机选取一个类别进行可视化。
+          如果为多个类别组成的列表，则在同一个窗口中依次显示各类别，按 N 键切换到下一个类别。
 
     Raises:
-        ValueError: 当 Data_Graphics 为 False 且没有指定 idx2Graphics 时，如果未找到类别标签，会抛出错误。
+        ValueError: 当 Data_Graphics 为 False 且指定的 idx2Graphics 不在真实或预测标签中时，会抛出错误。
 
     Description:
         该函数根据输入参数执行以下功能：
@@ -86,21 +185,37 @@ def xyz_visual_difference(pt_xyz, label_gt, label_pred, Data_Graphics: bool = Tr
     """
     unique_classes = np.union1d(label_gt, label_pred)
     if Data_Graphics is True:
+        # 混淆矩阵，行顺序与 unique_classes 对齐：将 (gt, pred) 编码为 gt * K + pred 后一次 bincount 统计
+        K = unique_classes.size
+        gt_idx = np.searchsorted(unique_classes, label_gt)
+        pred_idx = np.searchsorted(unique_classes, label_pred)
+        c_m = np.bincount(gt_idx * K + pred_idx, minlength=K * K).reshape(K, K)
         for i in range(len(unique_classes)):
             print(f'GT-{unique_classes[i]} ', end='')
-            c_m = confusion_matrix(label_gt, label_pred)  # 混淆矩阵
             print(f'{c_m[i]}')
     else:
         if idx2Graphics is None:
             idx = np.random.randint(0, len(unique_classes))
             idx2Graphics = unique_classes[idx]  # 生成随机类别
-        for i in range(len(unique_classes)):
-            label_gt_inds = (label_gt == unique_classes[i])  # 获取gt的某个类别的所有索引
-            label_gt_pred = label_pred[label_gt_inds]  # gt的类别索引下的 pred类别
-            if idx2Graphics == unique_classes[i]:
-                print(f'当前生成的类别为: {idx2Graphics}')
-                xyz_visual(pt_xyz=pt_xyz[label_gt_inds], pt_labels=label_gt_pred)
-                break
+        elif not np.isin(idx2Graphics, unique_classes).all():
+            raise ValueError(f"类别 {idx2Graphics} 不在标签中")
+        if np.ndim(idx2Graphics) == 0:
+            label_gt_inds = (label_gt == idx2Graphics)  # 获取gt的该类别的所有索引
+            print(f'当前生成的类别为: {idx2Graphics}')
+            xyz_visual(pt_xyz=pt_xyz[label_gt_inds], pt_labels=label_pred[label_gt_inds])  # gt的类别索引下的 pred类别
+        else:
+            # 多个类别：复用同一个窗口依次显示，各帧中同一 pred 类别的颜色保持一致
+            label2colors = {label: np.random.rand(3) for label in unique_classes}
+            live = LiveXYZVisualizer()
+            try:
+                for cls in idx2Graphics:
+                    label_gt_inds = (label_gt == cls)
+                    print(f'当前生成的类别为: {cls}')
+                    live.update(pt_xyz[label_gt_inds], _labels_to_colors(label_pred[label_gt_inds], label2colors))
+                    if not live.wait():
+                        break
+            finally:
+                live.close()
 
 
 
@@ -0,0 +1,175 @@
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from Point3D import preprocessing
+
+
+def _reference_split(horizontalAxis, verticalAxis, rowH, colW, overlapH=0, overlapW=0, areaBrokenMerge=True,
+                     ptBrokenMerge=None):
+    """原始的逐行/列布尔掩码实现，作为分块结果的参照"""
+    split_idx = defaultdict(list)
+    maxX, minX = horizontalAxis.max(), horizontalAxis.min()
+    stepX = colW * (1 - overlapW)
+    xNums, xExtra = divmod(maxX - minX, stepX)
+    maxY, minY = verticalAxis.max(), verticalAxis.min()
+    stepY = rowH * (1 - overlapH)
+    yNums, yExtra = divmod(maxY - minY, stepY)
+    judgeXresult = [
+        (minX + i * stepX <= horizontalAxis) & (horizontalAxis <= np.clip(minX + i * stepX + colW, minX, maxX))
+        for i in range(int(xNums) + 1)]
+    judgeYresult = [
+        (minY + j * stepY <= verticalAxis) & (verticalAxis <= np.clip(minY + j * stepY + rowH, minY, maxY))
+        for j in range(int(yNums) + 1)]
+    for n, judgeY in enumerate(judgeYresult):
+        for m, judgeX in enumerate(judgeXresult):
+            valid_idx = np.where(judgeX & judgeY)[0]
+            if valid_idx.size > 0:
+                split_idx[(n, m)].extend(valid_idx.tolist())
+    if areaBrokenMerge:
+        if xExtra < colW:
+            for n in range(len(judgeYresult)):
+                if (n, int(xNums)) in split_idx and (n, int(xNums) - 1) in split_idx:
+                    split_idx[(n, int(xNums) - 1)].extend(split_idx.pop((n, int(xNums))))
+        if yExtra < rowH:
+            for m in range(len(judgeXresult)):
+                if (int(yNums), m) in split_idx and (int(yNums) - 1, m) in split_idx:
+                    split_idx[(int(yNums) - 1, m)].extend(split_idx.pop((int(yNums), m)))
+    if ptBrokenMerge is not None:
+        for (rows, cols), pt_id in list(split_idx.items()):
+            if len(pt_id) <= ptBrokenMerge:
+                neighbor_blocks = [(rows + di, cols + dj) for di in [-1, 0, 1] for dj in [-1, 0, 1]
+                                   if (di != 0 or dj != 0) and (rows + di, cols + dj) in split_idx]
+                if neighbor_blocks:
+                    ni, nj = min(neighbor_blocks, key=lambda blk: len(split_idx[blk]))
+                    split_idx[(ni, nj)].extend(split_idx.pop((rows, cols)))
+    return split_idx
+
+
+def _off_edge_points(rng, n, extent):
+    """生成远离块边界的坐标：块步长均为 1，边界落在整数或 .25/.75 处，坐标的小数部分取 [0.3, 0.7]，并以 0 为最小值"""
+    axis = rng.integers(0, extent, n) + rng.uniform(0.3, 0.7, n)
+    axis[0] = 0.0
+    return axis
+
+
+# (块尺寸, 重叠度) 组合的步长均为 1
+@pytest.mark.parametrize("size, overlap", [(1.0, 0), (2.0, 0.5), (1.25, 0.2), (4.0, 0.75)])
+@pytest.mark.parametrize("areaBrokenMerge, ptBrokenMerge", [(False, None), (True, None), (True, 3), (False, 30)])
+@pytest.mark.parametrize("seed", range(5))
+def test_xyz_2Dsplit_matches_reference(size, overlap, areaBrokenMerge, ptBrokenMerge, seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(50, 2000))
+    h = _off_edge_points(rng, n, int(rng.integers(2, 30)))
+    v = _off_edge_points(rng, n, int(rng.integers(2, 30)))
+
+    expected = _reference_split(h, v, size, size, overlap, overlap, areaBrokenMerge, ptBrokenMerge)
+    split_idx = preprocessing.xyz_2Dsplit(h, v, size, size, overlap, overlap, areaBrokenMerge, ptBrokenMerge)
+
+    assert list(split_idx.keys()) == list(expected.keys())
+    for key, pt_ids in expected.items():
+        assert sorted(split_idx[key].tolist()) == sorted(pt_ids)
+
+
+@pytest.mark.parametrize("tile", [0.1, 0.3, 0.7, 2.5])
+@pytest.mark.parametrize("areaBrokenMerge, ptBrokenMerge", [(True, None), (False, 5), (True, 20)])
+def test_xyz_2Dsplit_backends_agree(monkeypatch, tile, areaBrokenMerge, ptBrokenMerge):
+    pytest.importorskip("numba")
+    # 量化到 0.1 的坐标大量落在块边界上，numba 与 NumPy 两种实现必须给出相同的分块
+    rng = np.random.default_rng(0)
+    h = np.round(rng.random(5000) * 50, 1)
+    v = np.round(rng.random(5000) * 40, 1)
+
+    with_numba = preprocessing.xyz_2Dsplit(h, v, tile, tile, 0, 0, areaBrokenMerge, ptBrokenMerge)
+    monkeypatch.setattr(preprocessing, "_bin_points", None)
+    with_numpy = preprocessing.xyz_2Dsplit(h, v, tile, tile, 0, 0, areaBrokenMerge, ptBrokenMerge)
+
+    assert with_numba == with_numpy
+
+
+def test_xyz_2Dsplit_show_output(capsys):
+    # 期望输出由原始实现生成
+    h = np.array([0.0, 0.4, 1.5, 1.6, 2.5, 3.5, 3.6, 0.5, 2.4, 3.3, 0.3, 1.4])
+    v = np.array([0.0, 0.5, 0.4, 1.5, 1.3, 0.6, 2.5, 2.6, 2.2, 1.4, 1.6, 0.7])
+    preprocessing.xyz_2Dsplit_show(h, v, 1.0, 1.0, 0, 0, True, 1)
+    assert capsys.readouterr().out == (
+        '\n总点数：12\n高：2.60 宽：3.60\n分割高：1.00 分割宽：1.00\n纵向重叠：0% 横向重叠：0%\n分割为 3✖4 块(包含空白)\n\n'
+        '初步分块的点数分布\n'
+        '     2,     2,      ,     1,\n'
+        '     1,     1,     1,     1,\n'
+        '     1,      ,     1,     1,\n'
+        '\n开始(向左/上)合并不足1.0✖1.0的块\n合并后分块的点数分布:\n'
+        '     2,     2,      ,     1,\n'
+        '     2,     1,     4,      ,\n'
+        '      ,      ,      ,      ,\n'
+        '\n开始合并点数小于1的分块:\n合并后分块的点数分布:\n'
+        '     3,     2,      ,      ,\n'
+        '     2,      ,     5,      ,\n'
+        '      ,      ,      ,      ,\n')
+
+
+def test_split_behaves_like_dict():
+    h = np.array([0.0, 0.5, 1.5, 2.5, 2.6])
+    v = np.array([0.0, 0.5, 0.2, 1.5, 1.7])
+    split_idx = preprocessing.xyz_2Dsplit(h, v, 1.0, 1.0, areaBrokenMerge=False)
+    expected = {(0, 0): [0, 1], (0, 1): [2], (1, 2): [3, 4]}
+
+    assert split_idx.shape == (2, 3)
+    assert split_idx.counts.tolist() == [[2, 1, 0], [0, 0, 2]]
+    assert list(split_idx) == list(split_idx.keys()) == list(expected)
+    assert len(split_idx) == 3
+    assert [(key, pt_id.tolist()) for key, pt_id in split_idx.items()] == list(expected.items())
+    assert [pt_id.tolist() for pt_id in split_idx.values()] == list(expected.values())
+    assert split_idx.keys() == expected.keys()
+
+    assert (1, 2) in split_idx and (1, 2) in split_idx.keys()
+    for missing in [(0, 2), (1, 0), (2, 0), (0, 3), (-1, 0), 5, (1, 2, 3), "a"]:
+        assert missing not in split_idx
+    assert split_idx[(0, 1)].tolist() == [2]
+    assert split_idx[(1, 1)].size == 0
+    assert split_idx.get(1, 2).tolist() == [3, 4]
+    assert split_idx.get((1, 2)).tolist() == [3, 4]
+    assert split_idx.get((1, 1)) is None
+    assert split_idx.get((1, 1), []) == []
+
+    assert split_idx == preprocessing.xyz_2Dsplit(h, v, 1.0, 1.0, areaBrokenMerge=False)
+    assert split_idx != preprocessing.xyz_2Dsplit(h, v, 1.0, 1.0, areaBrokenMerge=False, ptBrokenMerge=1)
+    assert split_idx != expected
+
+
+@pytest.mark.parametrize("areaBrokenMerge, ptBrokenMerge, expected", [
+    (False, None, {(0, 0): [0, 1], (0, 1): [2, 11], (0, 3): [5], (1, 0): [10], (1, 1): [3], (1, 2): [4],
+                   (1, 3): [9], (2, 0): [7], (2, 2): [8], (2, 3): [6]}),
+    # 最右列并入左列、最下行并入上一行；(2, 3) 先并入 (2, 2)，再随 (2, 2) 并入 (1, 2)
+    (True, None, {(0, 0): [0, 1], (0, 1): [2, 11], (0, 3): [5], (1, 0): [7, 10], (1, 1): [3],
+                  (1, 2): [4, 6, 8, 9]}),
+    # 点数 <= 1 的块并入点数最少的相邻块，点数相同时取先出现的邻块
+    (True, 1, {(0, 0): [0, 1, 3], (0, 1): [2, 11], (1, 0): [7, 10], (1, 2): [4, 5, 6, 8, 9]}),
+    (False, 2, {(1, 0): [0, 1, 7, 10], (1, 1): [2, 3, 11], (1, 3): [4, 5, 6, 8, 9]}),
+])
+def test_xyz_2Dsplit_merges(areaBrokenMerge, ptBrokenMerge, expected):
+    h = np.array([0.0, 0.4, 1.5, 1.6, 2.5, 3.5, 3.6, 0.5, 2.4, 3.3, 0.3, 1.4])
+    v = np.array([0.0, 0.5, 0.4, 1.5, 1.3, 0.6, 2.5, 2.6, 2.2, 1.4, 1.6, 0.7])
+    split_idx = preprocessing.xyz_2Dsplit(h, v, 1.0, 1.0, 0, 0, areaBrokenMerge, ptBrokenMerge)
+
+    assert {key: pt_id.tolist() for key, pt_id in split_idx.items()} == expected
+    assert list(split_idx) == list(expected)
+
+
+@pytest.mark.parametrize("size, overlap, expected", [
+    # 重叠 50%：每轴最多跨 2 块，走 _OVERLAP_EMIT 查表展开
+    (2.0, 0.5, {(0, 0): [0, 1, 2], (0, 1): [2], (1, 0): [1], (1, 1): [3], (1, 2): [3], (2, 1): [3],
+                (2, 2): [3]}),
+    # 重叠 75%：每轴最多跨 3 块，走通用的 repeat 展开
+    (4.0, 0.75, {(0, 0): [0, 1, 2, 3], (0, 1): [2, 3], (0, 2): [3], (1, 0): [1, 3], (1, 1): [3], (1, 2): [3],
+                 (2, 0): [3], (2, 1): [3], (2, 2): [3]}),
+])
+def test_xyz_2Dsplit_overlap(size, overlap, expected):
+    h = np.array([0.0, 0.5, 1.5, 2.6])
+    v = np.array([0.0, 1.5, 0.5, 2.6])
+    split_idx = preprocessing.xyz_2Dsplit(h, v, size, size, overlap, overlap, areaBrokenMerge=False)
+
+    assert {key: pt_id.tolist() for key, pt_id in split_idx.items()} == expected
+    assert {key: sorted(pt_id) for key, pt_id in _reference_split(h, v, size, size, overlap, overlap, False).items()} \
+        == expected